@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+from collections import ChainMap
+from collections.abc import Iterable, Mapping
 from datetime import date, datetime, time
-from pathlib import Path
-from typing import Any
+from functools import lru_cache
+import os
+import re
+from types import MappingProxyType
+from typing import Any, Callable
+import unicodedata
 import uuid
 
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import callback
-from homeassistant.data_entry_flow import FlowResult
+from homeassistant.data_entry_flow import FlowHandler, FlowResult
 from homeassistant.helpers import config_validation as cv, selector
 from homeassistant.util import dt as dt_util, slugify
 from .const import (
@@ -39,82 +45,68 @@ from .const import (
     CONF_PHOTO,
     CONF_REFERENCE_YEAR,
     CONF_REFERENCE_YEAR_CUSTODY,
-    CONF_REFERENCE_YEAR_VACATIONS,
     CONF_SCHOOL_LEVEL,
     CONF_START_DAY,
     CONF_SUMMER_SPLIT_MODE,
     CONF_VACATION_SPLIT_MODE,
     CONF_ZONE,
-    CUSTODY_TYPES,
+    CUSTODY_TYPE_KEYS_SORTED,
     DOMAIN,
-    FRENCH_ZONES,
     FRENCH_ZONES_WITH_CITIES,
     HOLIDAY_API,
-    REFERENCE_YEARS,
     VACATION_SPLIT_MODES,
 )
 
 
 ALLOWED_PHOTO_PREFIXES = ("http://", "https://", "media-source://", "data:")
-ALLOWED_PHOTO_PREFIXES_CI = tuple(prefix.lower() for prefix in ALLOWED_PHOTO_PREFIXES)
-
-
-def _validate_time(value: str) -> str:
-    """Ensure HH:MM format."""
-    if isinstance(value, (int, float)):
-        raise vol.Invalid("Expected HH:MM string")
-    parts = str(value).split(":")
-    if len(parts) != 2:
-        raise vol.Invalid("Use HH:MM format")
-    hour, minute = parts
-    try:
-        hour_i = int(hour)
-        minute_i = int(minute)
-    except ValueError as err:
-        raise vol.Invalid("Invalid time digits") from err
-    if not 0 <= hour_i <= 23 or not 0 <= minute_i <= 59:
-        raise vol.Invalid("Time must be within 00:00-23:59")
-    return f"{hour_i:02d}:{minute_i:02d}"
-
-
-def _format_child_name(value: str) -> str:
-    """Normalize child name to ASCII words recognized by Home Assistant."""
-    normalized = slugify(value, separator=" ").strip()
-    if not normalized:
-        return ""
-    return " ".join(part.capitalize() for part in normalized.split())
-
-
-def _zone_selector() -> selector.SelectSelector:
-    """Create a zone selector with city labels."""
-    options_list = [
-        {"value": zone, "label": FRENCH_ZONES_WITH_CITIES.get(zone, zone)} for zone in FRENCH_ZONES
-    ]
-    return selector.SelectSelector(
-        selector.SelectSelectorConfig(
-            options=options_list,
-            mode=selector.SelectSelectorMode.DROPDOWN,
-        )
-    )
-
-
-def _school_level_selector() -> selector.SelectSelector:
-    """Return selector for school level."""
-    return selector.SelectSelector(
-        selector.SelectSelectorConfig(
-            options=[
-                {"value": "primary", "label": "Primaire"},
-                {"value": "middle", "label": "Collège"},
-                {"value": "high", "label": "Lycée"},
-            ],
-            mode=selector.SelectSelectorMode.DROPDOWN,
-        )
-    )
-
+# Case-insensitive prefix check that never copies the (possibly huge) data: URI
+_PHOTO_PREFIX_RE = re.compile(
+    "|".join(re.escape(prefix) for prefix in ALLOWED_PHOTO_PREFIXES), re.IGNORECASE
+)
 
-def _custody_type_selector() -> selector.SelectSelector:
-    """Create a custody type selector with French labels."""
-    translations = {
+# H:MM or HH:MM within 00:00-23:59, with optional seconds
+_TIME_RE = re.compile(r"^([01]?\d|2[0-3]):([0-5]\d)(:[0-5]\d)?$")
+# Already canonical HH:MM, which needs no reformatting
+_HHMM_RE = re.compile(r"(?:[01]\d|2[0-3]):[0-5]\d")
+# Names slugify would only lowercase; hyphens and apostrophes become separators
+_ASCII_NAME_RE = re.compile(r"^[A-Za-z0-9 ]*[A-Za-z0-9][A-Za-z0-9 ]*$")
+# str.translate table deleting the combining marks slugify's transliteration drops
+# (U+0300-U+034E). Later marks map to "[?]", spaces or letters (U+0363-U+036F),
+# so names containing them stay non-ASCII and take the slugify fallback.
+_COMBINING_MARKS = dict.fromkeys(range(0x0300, 0x034F))
+# Holiday API URLs must contain both {year} and {zone}, in any order
+_API_URL_PLACEHOLDERS_RE = re.compile(r"(?=.*\{year\})(?=.*\{zone\})", re.DOTALL)
+
+# Fallback values for fields missing from the stored configuration
+_FIELD_DEFAULTS: dict[str, Any] = {
+    CONF_CUSTODY_TYPE: "alternate_week",
+    CONF_REFERENCE_YEAR: "even",
+    CONF_START_DAY: "monday",
+    CONF_ARRIVAL_TIME: "08:00",
+    CONF_DEPARTURE_TIME: "19:00",
+    CONF_LOCATION: "",
+    CONF_ZONE: "A",
+    CONF_SCHOOL_LEVEL: "primary",
+    CONF_VACATION_SPLIT_MODE: "odd_first",
+    CONF_SUMMER_SPLIT_MODE: "half",
+    CONF_ALSACE_MOSELLE: False,
+    CONF_PARENTAL_ROLE: "none",
+    CONF_AUTO_PARENT_DAYS: True,
+    CONF_NOTES: "",
+    CONF_NOTIFICATIONS: False,
+    CONF_CALENDAR_SYNC: False,
+    CONF_CALENDAR_TARGET: "",
+    CONF_CALENDAR_SYNC_DAYS: 120,
+    CONF_CALENDAR_SYNC_INTERVAL_HOURS: 1,
+    CONF_HOLIDAY_API_URL: "",
+}
+
+# Week-parity based types ignore the start day, so the field is hidden for them
+_NO_START_DAY_CUSTODY = frozenset({"alternate_weekend", "alternate_week_parity"})
+
+# French labels for the select options, read-only since every form shares them
+_CUSTODY_TYPE_LABELS = MappingProxyType(
+    {
         "alternate_week": "Semaines alternées (1/1)",
         "alternate_week_parity": "Semaines alternées",
         "alternate_weekend": "Week-ends alternés",
@@ -122,37 +114,10 @@ def _custody_type_selector() -> selector.SelectSelector:
         "two_two_five_five": "2-2-5-5",
         "custom": "Personnalisé",
     }
-    options_list = [
-        {"value": key, "label": translations.get(key, key)} for key in sorted(CUSTODY_TYPES.keys())
-    ]
-    return selector.SelectSelector(
-        selector.SelectSelectorConfig(
-            options=options_list,
-            mode=selector.SelectSelectorMode.DROPDOWN,
-        )
-    )
-
-
-def _reference_year_selector() -> selector.SelectSelector:
-    """Create a reference year selector with French labels."""
-    translations = {
-        "even": "Paire",
-        "odd": "Impaire",
-    }
-    options_list = [
-        {"value": year, "label": translations.get(year, year)} for year in REFERENCE_YEARS
-    ]
-    return selector.SelectSelector(
-        selector.SelectSelectorConfig(
-            options=options_list,
-            mode=selector.SelectSelectorMode.LIST,
-        )
-    )
-
-
-def _start_day_selector() -> selector.SelectSelector:
-    """Create a start day selector with French labels."""
-    translations = {
+)
+_START_DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+_START_DAY_LABELS = MappingProxyType(
+    {
         "monday": "Lundi",
         "tuesday": "Mardi",
         "wednesday": "Mercredi",
@@ -161,50 +126,203 @@ def _start_day_selector() -> selector.SelectSelector:
         "saturday": "Samedi",
         "sunday": "Dimanche",
     }
-    days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-    options_list = [
-        {"value": day, "label": translations.get(day, day)} for day in days
-    ]
+)
+_VACATION_SPLIT_LABELS = MappingProxyType(
+    {
+        "odd_first": "Années impaires = 1ère moitié (années paires = 2ème moitié)",
+        "odd_second": "Années impaires = 2ème moitié (années paires = 1ère moitié)",
+    }
+)
+
+
+def _select_selector(
+    options: Iterable[tuple[str, str]], mode: selector.SelectSelectorMode
+) -> selector.SelectSelector:
+    """Build a select selector from (value, label) pairs."""
+    # SelectSelectorConfig only accepts a list of plain dicts, so the immutable
+    # option tables are converted here, once per selector.
     return selector.SelectSelector(
         selector.SelectSelectorConfig(
-            options=options_list,
-            mode=selector.SelectSelectorMode.DROPDOWN,
+            options=[{"value": value, "label": label} for value, label in options],
+            mode=mode,
         )
     )
 
 
+_WEEKDAY_SHORT_LABELS = ("Lun", "Mar", "Mer", "Jeu", "Ven", "Sam", "Dim")
+_WEEKDAY_OPTIONS = (
+    ("0", "Lundi"),
+    ("1", "Mardi"),
+    ("2", "Mercredi"),
+    ("3", "Jeudi"),
+    ("4", "Vendredi"),
+    ("5", "Samedi"),
+    ("6", "Dimanche"),
+)
+_WEEKDAY_SELECTOR = _select_selector(_WEEKDAY_OPTIONS, selector.SelectSelectorMode.DROPDOWN)
+_REFERENCE_YEAR_CUSTODY_SELECTOR = _select_selector(
+    (
+        ("even", "Je l'ai les années paires"),
+        ("odd", "Je l'ai les années impaires"),
+    ),
+    selector.SelectSelectorMode.LIST,
+)
+_PARENTAL_ROLE_SELECTOR = _select_selector(
+    (
+        ("none", "Aucun (Désactivé)"),
+        ("father", "Papa"),
+        ("mother", "Maman"),
+    ),
+    selector.SelectSelectorMode.DROPDOWN,
+)
+_CALENDAR_TARGET_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain="calendar"))
+_CALENDAR_SYNC_DAYS_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=7, max=365, mode=selector.NumberSelectorMode.BOX, step=1)
+)
+_CALENDAR_SYNC_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=24, mode=selector.NumberSelectorMode.BOX, step=1)
+)
 
+# Static form schemas, built once at import instead of on every render
+_EMPTY_SCHEMA = vol.Schema({})
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_CHILD_NAME): cv.string,
+        vol.Optional(CONF_ICON, default="mdi:account"): selector.IconSelector(),
+        vol.Optional(CONF_PHOTO): cv.string,
+    }
+)
+_EXCEPTIONS_ADD_SCHEMA = vol.Schema(
+    {
+        vol.Optional("label"): cv.string,
+        vol.Required("start"): selector.DateTimeSelector(),
+        vol.Required("end"): selector.DateTimeSelector(),
+    }
+)
+_EXCEPTIONS_RECURRING_ADD_SCHEMA = vol.Schema(
+    {
+        vol.Optional("label"): cv.string,
+        vol.Required("weekday"): _WEEKDAY_SELECTOR,
+        vol.Required("start_time"): selector.TimeSelector(),
+        vol.Required("end_time"): selector.TimeSelector(),
+        vol.Optional("start_date"): selector.DateSelector(),
+        vol.Optional("end_date"): selector.DateSelector(),
+    }
+)
 
 
-def _summer_split_selector() -> selector.SelectSelector:
-    """Create a selector for summer split mode (halves vs quarters)."""
-    options_list = [
-        {"value": "half", "label": "2 Moitiés (Juillet / Août)"},
-        {"value": "quarter", "label": "4 Quinzaines (Alternance tous les 15j)"},
-    ]
-    return selector.SelectSelector(
-        selector.SelectSelectorConfig(
-            options=options_list,
-            mode=selector.SelectSelectorMode.DROPDOWN,
-        )
-    )
-
+@lru_cache(maxsize=256)
+def _format_child_name(value: str) -> tuple[str, str]:
+    """Normalize child name to ASCII words and return it with its slug."""
+    folded = value
+    if not value.isascii():
+        # Accented Latin letters decompose to ASCII plus combining marks; dropping
+        # the marks gives the same letters slugify's transliteration would.
+        folded = unicodedata.normalize("NFKD", value).translate(_COMBINING_MARKS)
+    if _ASCII_NAME_RE.match(folded):
+        # Plain ASCII words come out of slugify unchanged apart from case
+        words = folded.lower().split()
+    else:
+        words = slugify(value, separator=" ").split()
+    if not words:
+        return "", ""
+    return " ".join(word.capitalize() for word in words), "_".join(words)
+
+
+# Selectors never change at runtime, so each is built once and shared by every form
+# FRENCH_ZONES_WITH_CITIES holds every zone, in FRENCH_ZONES order
+_ZONE_SELECTOR = _select_selector(FRENCH_ZONES_WITH_CITIES.items(), selector.SelectSelectorMode.DROPDOWN)
+_SCHOOL_LEVEL_SELECTOR = _select_selector(
+    (
+        ("primary", "Primaire"),
+        ("middle", "Collège"),
+        ("high", "Lycée"),
+    ),
+    selector.SelectSelectorMode.DROPDOWN,
+)
+_CUSTODY_TYPE_SELECTOR = _select_selector(
+    ((key, _CUSTODY_TYPE_LABELS.get(key, key)) for key in CUSTODY_TYPE_KEYS_SORTED),
+    selector.SelectSelectorMode.DROPDOWN,
+)
+_START_DAY_SELECTOR = _select_selector(
+    ((day, _START_DAY_LABELS.get(day, day)) for day in _START_DAYS),
+    selector.SelectSelectorMode.DROPDOWN,
+)
+_SUMMER_SPLIT_SELECTOR = _select_selector(
+    (
+        ("half", "2 Moitiés (Juillet / Août)"),
+        ("quarter", "4 Quinzaines (Alternance tous les 15j)"),
+    ),
+    selector.SelectSelectorMode.DROPDOWN,
+)
+_VACATION_SPLIT_SELECTOR = _select_selector(
+    ((mode, _VACATION_SPLIT_LABELS.get(mode, mode)) for mode in VACATION_SPLIT_MODES),
+    selector.SelectSelectorMode.DROPDOWN,
+)
 
-def _vacation_split_selector() -> selector.SelectSelector:
-    """Create a selector for vacation split mode (odd/even halves)."""
-    translations = {
-        "odd_first": "Années impaires = 1ère moitié (années paires = 2ème moitié)",
-        "odd_second": "Années impaires = 2ème moitié (années paires = 1ère moitié)",
+# Custody/schedule schemas are compiled once with static defaults; stored values
+# are layered on at render time as suggested values.
+_CUSTODY_TYPE_FIELDS = {
+    vol.Required(CONF_CUSTODY_TYPE, default=_FIELD_DEFAULTS[CONF_CUSTODY_TYPE]): _CUSTODY_TYPE_SELECTOR,
+    # Unified label for reference year
+    vol.Required(CONF_REFERENCE_YEAR_CUSTODY, default="even"): _REFERENCE_YEAR_CUSTODY_SELECTOR,
+}
+_SCHEDULE_FIELDS = {
+    vol.Required(CONF_ARRIVAL_TIME, default=_FIELD_DEFAULTS[CONF_ARRIVAL_TIME]): selector.TimeSelector(),
+    vol.Required(CONF_DEPARTURE_TIME, default=_FIELD_DEFAULTS[CONF_DEPARTURE_TIME]): selector.TimeSelector(),
+    vol.Optional(CONF_LOCATION, default=_FIELD_DEFAULTS[CONF_LOCATION]): cv.string,
+}
+_START_DAY_FIELD = {
+    vol.Required(CONF_START_DAY, default=_FIELD_DEFAULTS[CONF_START_DAY]): _START_DAY_SELECTOR,
+}
+_CUSTODY_SCHEMA = vol.Schema({**_CUSTODY_TYPE_FIELDS, **_SCHEDULE_FIELDS})
+_CUSTODY_SCHEMA_WITH_START_DAY = vol.Schema(
+    {**_CUSTODY_TYPE_FIELDS, **_SCHEDULE_FIELDS, **_START_DAY_FIELD}
+)
+_OPTIONS_CUSTODY_SCHEMA = vol.Schema(_CUSTODY_TYPE_FIELDS)
+_OPTIONS_CUSTODY_SCHEMA_WITH_START_DAY = vol.Schema(
+    {**_CUSTODY_TYPE_FIELDS, **_START_DAY_FIELD}
+)
+_SCHEDULE_SCHEMA = vol.Schema(_SCHEDULE_FIELDS)
+_VACATIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ZONE, default=_FIELD_DEFAULTS[CONF_ZONE]): _ZONE_SELECTOR,
+        vol.Optional(CONF_SCHOOL_LEVEL, default=_FIELD_DEFAULTS[CONF_SCHOOL_LEVEL]): _SCHOOL_LEVEL_SELECTOR,
+        vol.Required(
+            CONF_VACATION_SPLIT_MODE, default=_FIELD_DEFAULTS[CONF_VACATION_SPLIT_MODE]
+        ): _VACATION_SPLIT_SELECTOR,
+        vol.Required(
+            CONF_SUMMER_SPLIT_MODE, default=_FIELD_DEFAULTS[CONF_SUMMER_SPLIT_MODE]
+        ): _SUMMER_SPLIT_SELECTOR,
+        vol.Optional(CONF_ALSACE_MOSELLE, default=_FIELD_DEFAULTS[CONF_ALSACE_MOSELLE]): selector.BooleanSelector(),
+        vol.Required(CONF_PARENTAL_ROLE, default=_FIELD_DEFAULTS[CONF_PARENTAL_ROLE]): _PARENTAL_ROLE_SELECTOR,
+        vol.Optional(
+            CONF_AUTO_PARENT_DAYS, default=_FIELD_DEFAULTS[CONF_AUTO_PARENT_DAYS]
+        ): selector.BooleanSelector(),
     }
-    options_list = [
-        {"value": mode, "label": translations.get(mode, mode)} for mode in VACATION_SPLIT_MODES
-    ]
-    return selector.SelectSelector(
-        selector.SelectSelectorConfig(
-            options=options_list,
-            mode=selector.SelectSelectorMode.DROPDOWN,
-        )
-    )
+)
+_ADVANCED_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_NOTES, default=_FIELD_DEFAULTS[CONF_NOTES]): cv.string,
+        vol.Optional(CONF_NOTIFICATIONS, default=_FIELD_DEFAULTS[CONF_NOTIFICATIONS]): cv.boolean,
+        vol.Optional(CONF_CALENDAR_SYNC, default=_FIELD_DEFAULTS[CONF_CALENDAR_SYNC]): cv.boolean,
+        vol.Optional(
+            CONF_CALENDAR_TARGET, default=_FIELD_DEFAULTS[CONF_CALENDAR_TARGET]
+        ): _CALENDAR_TARGET_SELECTOR,
+        vol.Optional(
+            CONF_CALENDAR_SYNC_DAYS, default=_FIELD_DEFAULTS[CONF_CALENDAR_SYNC_DAYS]
+        ): _CALENDAR_SYNC_DAYS_SELECTOR,
+        vol.Optional(
+            CONF_CALENDAR_SYNC_INTERVAL_HOURS, default=_FIELD_DEFAULTS[CONF_CALENDAR_SYNC_INTERVAL_HOURS]
+        ): _CALENDAR_SYNC_INTERVAL_SELECTOR,
+        # Suggests the default API until a custom URL has been saved
+        vol.Optional(
+            CONF_HOLIDAY_API_URL,
+            default=_FIELD_DEFAULTS[CONF_HOLIDAY_API_URL],
+            description={"suggested_value": HOLIDAY_API},
+        ): cv.string,
+    }
+)
 
 
 def _time_to_str(value: Any, default: str) -> str:
@@ -216,11 +334,26 @@ def _time_to_str(value: Any, default: str) -> str:
     - "HH:MM:SS" strings (extracts HH:MM)
     - None (returns default)
     """
-    if value is None:
+    # Selector strings are the common case, so they are checked first
+    if isinstance(value, str):
+        # Canonical "HH:MM" is returned as-is
+        if _HHMM_RE.fullmatch(value):
+            return value
+        text = value.strip()
+    elif value is None:
         return default
-    if hasattr(value, "strftime"):
+    elif hasattr(value, "strftime"):
         return value.strftime("%H:%M")
-    text = str(value).strip()
+    else:
+        text = str(value).strip()
+    # The pattern range-checks hours/minutes and drops any seconds
+    match = _TIME_RE.match(text)
+    if match is not None:
+        if len(match.group(1)) == 2:
+            # Zero-padded "HH:MM[:SS]" only needs its seconds cut off
+            return text[:5]
+        return f"{match.group(1).zfill(2)}:{match.group(2)}"
+    # Other shapes ("HH:MM:SS.ffffff", "8:5") go through the lenient parser
     parts = text.split(":")
     if len(parts) >= 2:
         try:
@@ -295,13 +428,23 @@ def _normalize_weekday(value: Any) -> int | None:
 
 
 def _get_exceptions(data: dict[str, Any]) -> list[dict[str, Any]]:
-    exceptions = data.get(CONF_EXCEPTIONS_LIST, [])
-    return list(exceptions) if isinstance(exceptions, list) else []
+    """Return the stored list of manual exceptions, or an empty list."""
+    exceptions = data.get(CONF_EXCEPTIONS_LIST)
+    return exceptions if isinstance(exceptions, list) else []
 
 
 def _get_recurring_exceptions(data: dict[str, Any]) -> list[dict[str, Any]]:
-    exceptions = data.get(CONF_EXCEPTIONS_RECURRING, [])
-    return list(exceptions) if isinstance(exceptions, list) else []
+    """Return the stored list of recurring exceptions, or an empty list."""
+    exceptions = data.get(CONF_EXCEPTIONS_RECURRING)
+    return exceptions if isinstance(exceptions, list) else []
+
+
+def _find_exception(exceptions: list[dict[str, Any]], exception_id: str | None) -> int | None:
+    """Return the index of the exception with the given id."""
+    for index, item in enumerate(exceptions):
+        if item.get("id") == exception_id:
+            return index
+    return None
 
 
 def _format_exception_label(item: dict[str, Any]) -> str:
@@ -316,13 +459,51 @@ def _format_exception_label(item: dict[str, Any]) -> str:
 def _format_recurring_label(item: dict[str, Any]) -> str:
     label = item.get("label") or "Exception récurrente"
     weekday = item.get("weekday")
-    weekdays = ["Lun", "Mar", "Mer", "Jeu", "Ven", "Sam", "Dim"]
-    day_label = weekdays[weekday] if isinstance(weekday, int) and 0 <= weekday <= 6 else "?"
+    day_label = _WEEKDAY_SHORT_LABELS[weekday] if isinstance(weekday, int) and 0 <= weekday <= 6 else "?"
     start_time = item.get("start_time") or "?"
     end_time = item.get("end_time") or "?"
     return f"{label} — {day_label} {start_time} → {end_time}"
 
 
+def _validate_advanced_input(cleaned: dict[str, Any]) -> dict[str, str]:
+    """Validate the advanced step in place and return the form errors."""
+    errors: dict[str, str] = {}
+    calendar_sync = cleaned.get(CONF_CALENDAR_SYNC, False)
+    calendar_target = cleaned.get(CONF_CALENDAR_TARGET, "") or ""
+    if calendar_sync and not str(calendar_target).strip():
+        errors[CONF_CALENDAR_TARGET] = "calendar_target_required"
+
+    # Validate API URL if provided
+    api_url = (cleaned.get(CONF_HOLIDAY_API_URL) or "").strip()
+    if api_url:
+        cleaned[CONF_HOLIDAY_API_URL] = api_url
+        # Basic validation: must contain {year} and {zone} placeholders
+        if _API_URL_PLACEHOLDERS_RE.match(api_url) is None:
+            errors[CONF_HOLIDAY_API_URL] = "api_url_missing_placeholders"
+    else:
+        cleaned.pop(CONF_HOLIDAY_API_URL, None)
+    return errors
+
+
+def _custody_form_schema(
+    flow: FlowHandler, data: Mapping[str, Any], include_times: bool
+) -> vol.Schema:
+    """Return the custody form for the stored custody type, prefilled from data."""
+    # start_day is only relevant for custody types that use cycles (not alternate_weekend/alternate_week_parity)
+    if data.get(CONF_CUSTODY_TYPE, _FIELD_DEFAULTS[CONF_CUSTODY_TYPE]) in _NO_START_DAY_CUSTODY:
+        schema = _CUSTODY_SCHEMA if include_times else _OPTIONS_CUSTODY_SCHEMA
+    elif include_times:
+        schema = _CUSTODY_SCHEMA_WITH_START_DAY
+    else:
+        schema = _OPTIONS_CUSTODY_SCHEMA_WITH_START_DAY
+    reference_year = data.get(
+        CONF_REFERENCE_YEAR_CUSTODY, data.get(CONF_REFERENCE_YEAR, _FIELD_DEFAULTS[CONF_REFERENCE_YEAR])
+    )
+    return flow.add_suggested_values_to_schema(
+        schema, ChainMap({CONF_REFERENCE_YEAR_CUSTODY: reference_year}, data)
+    )
+
+
 class CustodyScheduleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle the step-driven configuration."""
 
@@ -330,116 +511,72 @@ class CustodyScheduleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         self._data: dict[str, Any] = {}
+        # Normalized www/ directory, looked up on the first local photo
+        self._www_dir: str | None = None
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Gather child information (step 1)."""
         errors: dict[str, str] = {}
         if user_input:
-            cleaned_input = dict(user_input)
-
-            name_value = cleaned_input.get(CONF_CHILD_NAME)
+            name_value = user_input.get(CONF_CHILD_NAME)
             if isinstance(name_value, str):
                 display_name = name_value.strip()
-                formatted_name = _format_child_name(display_name)
+                formatted_name, child_slug = _format_child_name(display_name)
                 if formatted_name:
-                    cleaned_input[CONF_CHILD_NAME_DISPLAY] = display_name
-                    cleaned_input[CONF_CHILD_NAME] = formatted_name
+                    user_input[CONF_CHILD_NAME_DISPLAY] = display_name
+                    user_input[CONF_CHILD_NAME] = formatted_name
                 else:
                     errors[CONF_CHILD_NAME] = "invalid_child_name"
             else:
                 errors[CONF_CHILD_NAME] = "invalid_child_name"
 
-            icon_value = cleaned_input.get(CONF_ICON, "mdi:account")
+            icon_value = user_input.get(CONF_ICON, "mdi:account")
             if isinstance(icon_value, dict):
                 icon_value = icon_value.get("icon", icon_value.get("id"))
             if not isinstance(icon_value, str) or not icon_value.strip():
-                cleaned_input[CONF_ICON] = "mdi:account"
+                user_input[CONF_ICON] = "mdi:account"
             else:
-                cleaned_input[CONF_ICON] = icon_value
+                user_input[CONF_ICON] = icon_value
 
-            photo_value = cleaned_input.get(CONF_PHOTO)
+            photo_value = user_input.get(CONF_PHOTO)
             if isinstance(photo_value, str):
                 if photo_value.strip():
                     normalized, error_key = self._normalize_photo(photo_value)
                     if error_key:
                         errors[CONF_PHOTO] = error_key
                     else:
-                        cleaned_input[CONF_PHOTO] = normalized
+                        user_input[CONF_PHOTO] = normalized
                 else:
-                    cleaned_input.pop(CONF_PHOTO, None)
+                    user_input.pop(CONF_PHOTO, None)
 
             if not errors:
-                self._data.update(cleaned_input)
-                unique_id = slugify(cleaned_input[CONF_CHILD_NAME])
-                await self.async_set_unique_id(unique_id)
+                self._data.update(user_input)
+                await self.async_set_unique_id(child_slug)
                 # Allow multiple children with different names
                 # Only abort if the exact same child name is already configured
                 self._abort_if_unique_id_configured()
                 return await self.async_step_custody()
 
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_CHILD_NAME): cv.string,
-                vol.Optional(CONF_ICON, default="mdi:account"): selector.IconSelector(),
-                vol.Optional(CONF_PHOTO): cv.string,
-            },
-            extra=vol.ALLOW_EXTRA,
-        )
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA, errors=errors)
 
     async def async_step_custody(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Configure garde classique (weekends/semaines) - step 2."""
         if user_input:
-            cleaned = dict(user_input)
-            cleaned[CONF_ARRIVAL_TIME] = _time_to_str(user_input.get(CONF_ARRIVAL_TIME), "08:00")
-            cleaned[CONF_DEPARTURE_TIME] = _time_to_str(user_input.get(CONF_DEPARTURE_TIME), "19:00")
+            user_input[CONF_ARRIVAL_TIME] = _time_to_str(
+                user_input.get(CONF_ARRIVAL_TIME), _FIELD_DEFAULTS[CONF_ARRIVAL_TIME]
+            )
+            user_input[CONF_DEPARTURE_TIME] = _time_to_str(
+                user_input.get(CONF_DEPARTURE_TIME), _FIELD_DEFAULTS[CONF_DEPARTURE_TIME]
+            )
             # For alternate_weekend/alternate_week_parity, start_day is not used (based on ISO week parity)
             # But we still save it for other custody types
-            self._data.update(cleaned)
-            if cleaned[CONF_CUSTODY_TYPE] == "custom":
+            self._data.update(user_input)
+            if user_input[CONF_CUSTODY_TYPE] == "custom":
                 return await self.async_step_custom_pattern()
             return await self.async_step_vacations()
 
         # Use saved data if user goes back
-        custody_type = self._data.get(CONF_CUSTODY_TYPE, "alternate_week")
-        # start_day is only relevant for custody types that use cycles (not alternate_weekend/alternate_week_parity)
-        show_start_day = custody_type not in ("alternate_weekend", "alternate_week_parity")
-        
-        reference_year_default = self._data.get(
-            CONF_REFERENCE_YEAR_CUSTODY, self._data.get(CONF_REFERENCE_YEAR, "even")
-        )
-        schema_dict = {
-            vol.Required(
-                CONF_CUSTODY_TYPE, default=custody_type
-            ): _custody_type_selector(),
-            # Unified label for reference year
-            vol.Required(
-                CONF_REFERENCE_YEAR_CUSTODY, default=reference_year_default
-            ): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=[
-                        {"value": "even", "label": "Je l'ai les années paires"},
-                        {"value": "odd", "label": "Je l'ai les années impaires"},
-                    ],
-                    mode=selector.SelectSelectorMode.LIST,
-                )
-            ),
-            vol.Required(
-                CONF_ARRIVAL_TIME, default=self._data.get(CONF_ARRIVAL_TIME, "08:00")
-            ): selector.TimeSelector(),
-            vol.Required(
-                CONF_DEPARTURE_TIME, default=self._data.get(CONF_DEPARTURE_TIME, "19:00")
-            ): selector.TimeSelector(),
-            vol.Optional(CONF_LOCATION, default=self._data.get(CONF_LOCATION, "")): cv.string,
-        }
-        
-        # Only show start_day for custody types that use it
-        if show_start_day:
-            schema_dict[vol.Required(
-                CONF_START_DAY, default=self._data.get(CONF_START_DAY, "monday")
-            )] = _start_day_selector()
-        
-        schema = vol.Schema(schema_dict)
+        schema = _custody_form_schema(self, self._data, include_times=True)
         return self.async_show_form(
             step_id="custody", 
             data_schema=schema,
@@ -459,11 +596,10 @@ class CustodyScheduleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         schema_dict = {}
         # Get existing pattern if any
         existing = self._data.get(CONF_CUSTOM_PATTERN, "").split(",")
-        weekdays = ["Lun", "Mar", "Mer", "Jeu", "Ven", "Sam", "Dim"]
         for i in range(1, 15):
             week_num = 1 if i <= 7 else 2
             day_idx = (i - 1) % 7
-            label = f"S{week_num} - {weekdays[day_idx]}"
+            label = f"S{week_num} - {_WEEKDAY_SHORT_LABELS[day_idx]}"
             default = existing[i-1] == "on" if len(existing) >= i else False
             schema_dict[vol.Optional(f"day_{i}", default=default)] = selector.BooleanSelector()
             
@@ -478,120 +614,28 @@ class CustodyScheduleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._data.update(user_input)
             return await self.async_step_advanced()
 
-        # Get reference_year for vacations (separate from custody reference_year)
-        # Default to "even" if not set
-        reference_year_default = self._data.get(
-            CONF_REFERENCE_YEAR_VACATIONS, self._data.get(CONF_REFERENCE_YEAR, "even")
-        )
-        vacation_split_default = self._data.get(CONF_VACATION_SPLIT_MODE, "odd_first")
-        
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_ZONE, default=self._data.get(CONF_ZONE, "A")): _zone_selector(),
-                vol.Optional(
-                    CONF_SCHOOL_LEVEL, default=self._data.get(CONF_SCHOOL_LEVEL, "primary")
-                ): _school_level_selector(),
-                vol.Required(CONF_VACATION_SPLIT_MODE, default=vacation_split_default): _vacation_split_selector(),
-                vol.Required(
-                    CONF_SUMMER_SPLIT_MODE, default=self._data.get(CONF_SUMMER_SPLIT_MODE, "half")
-                ): _summer_split_selector(),
-                vol.Optional(
-                    CONF_ALSACE_MOSELLE, default=self._data.get(CONF_ALSACE_MOSELLE, False)
-                ): selector.BooleanSelector(),
-                vol.Required(
-                    CONF_PARENTAL_ROLE, default=self._data.get(CONF_PARENTAL_ROLE, "none")
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": "none", "label": "Aucun (Désactivé)"},
-                            {"value": "father", "label": "Papa"},
-                            {"value": "mother", "label": "Maman"},
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Optional(
-                    CONF_AUTO_PARENT_DAYS, default=self._data.get(CONF_AUTO_PARENT_DAYS, True)
-                ): selector.BooleanSelector(),
-            }
-        )
+        schema = self.add_suggested_values_to_schema(_VACATIONS_SCHEMA, self._data)
         return self.async_show_form(step_id="vacations", data_schema=schema)
 
     async def async_step_advanced(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Advanced optional settings (step 4)."""
         if user_input:
-            cleaned = dict(user_input)
-            errors: dict[str, str] = {}
-            calendar_sync = cleaned.get(CONF_CALENDAR_SYNC, False)
-            calendar_target = cleaned.get(CONF_CALENDAR_TARGET, "") or ""
-            if calendar_sync and not str(calendar_target).strip():
-                errors[CONF_CALENDAR_TARGET] = "calendar_target_required"
-
-            # Validate API URL if provided
-            api_url = cleaned.get(CONF_HOLIDAY_API_URL)
-            if api_url and api_url.strip():
-                # Basic validation: must contain {year} and {zone} placeholders
-                if "{year}" not in api_url or "{zone}" not in api_url:
-                    # Merge user input with existing data to preserve user's entry
-                    merged_data = {**self._data, **cleaned}
-                    return self.async_show_form(
-                        step_id="advanced",
-                        data_schema=self._get_advanced_schema(merged_data),
-                        errors={**errors, CONF_HOLIDAY_API_URL: "api_url_missing_placeholders"},
-                    )
-                cleaned[CONF_HOLIDAY_API_URL] = api_url.strip()
-            else:
-                cleaned.pop(CONF_HOLIDAY_API_URL, None)
+            errors = _validate_advanced_input(user_input)
             if errors:
-                merged_data = {**self._data, **cleaned}
-                return self.async_show_form(
-                    step_id="advanced",
-                    data_schema=self._get_advanced_schema(merged_data),
-                    errors=errors,
-                )
-            self._data.update(cleaned)
+                return self._advanced_error_form(user_input, errors)
+            self._data.update(user_input)
             title = self._data.get(CONF_CHILD_NAME_DISPLAY, self._data[CONF_CHILD_NAME])
             return self.async_create_entry(title=title, data=self._data)
 
-        return self.async_show_form(step_id="advanced", data_schema=self._get_advanced_schema(self._data))
+        schema = self.add_suggested_values_to_schema(_ADVANCED_SCHEMA, self._data)
+        return self.async_show_form(step_id="advanced", data_schema=schema)
 
-    def _get_advanced_schema(self, data: dict[str, Any] | None = None) -> vol.Schema:
-        """Get the advanced settings schema."""
-        if data is None:
-            data = {}
-        return vol.Schema(
-            {
-                vol.Optional(CONF_NOTES, default=data.get(CONF_NOTES, "")): cv.string,
-                vol.Optional(CONF_NOTIFICATIONS, default=data.get(CONF_NOTIFICATIONS, False)): cv.boolean,
-                vol.Optional(CONF_CALENDAR_SYNC, default=data.get(CONF_CALENDAR_SYNC, False)): cv.boolean,
-                vol.Optional(
-                    CONF_CALENDAR_TARGET,
-                    default=data.get(CONF_CALENDAR_TARGET, ""),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="calendar")
-                ),
-                vol.Optional(
-                    CONF_CALENDAR_SYNC_DAYS,
-                    default=data.get(CONF_CALENDAR_SYNC_DAYS, 120),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=7, max=365, mode=selector.NumberSelectorMode.BOX, step=1
-                    )
-                ),
-                vol.Optional(
-                    CONF_CALENDAR_SYNC_INTERVAL_HOURS,
-                    default=data.get(CONF_CALENDAR_SYNC_INTERVAL_HOURS, 1),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1, max=24, mode=selector.NumberSelectorMode.BOX, step=1
-                    )
-                ),
-                vol.Optional(
-                    CONF_HOLIDAY_API_URL,
-                    default=data.get(CONF_HOLIDAY_API_URL, ""),
-                    description={"suggested_value": HOLIDAY_API},
-                ): cv.string,
-            }
+    def _advanced_error_form(self, cleaned: dict[str, Any], errors: dict[str, str]) -> FlowResult:
+        """Show the advanced form again, keeping the user's entries."""
+        return self.async_show_form(
+            step_id="advanced",
+            data_schema=self.add_suggested_values_to_schema(_ADVANCED_SCHEMA, ChainMap(cleaned, self._data)),
+            errors=errors,
         )
 
     @staticmethod
@@ -606,8 +650,7 @@ class CustodyScheduleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if not value:
             return None, None
 
-        lowered = value.lower()
-        if lowered.startswith(ALLOWED_PHOTO_PREFIXES_CI):
+        if _PHOTO_PREFIX_RE.match(value):
             return value, None
 
         if value.startswith("/local/"):
@@ -615,18 +658,17 @@ class CustodyScheduleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if value.startswith("local/"):
             return f"/{value}", None
 
-        try:
-            www_dir = Path(self.hass.config.path("www")).resolve(strict=False)
-            candidate = Path(value)
-            if not candidate.is_absolute():
-                candidate = (www_dir / value).resolve(strict=False)
-            else:
-                candidate = candidate.resolve(strict=False)
-            relative = candidate.relative_to(www_dir)
-        except ValueError:
+        if self._www_dir is None:
+            self._www_dir = os.path.normpath(self.hass.config.path("www"))
+        www_dir = self._www_dir
+
+        # Lexical containment check: no filesystem access from the event loop
+        candidate = os.path.normpath(os.path.join(www_dir, value))
+        if not candidate.startswith(www_dir + os.sep):
             return None, "invalid_local_photo"
 
-        return f"/local/{relative.as_posix()}", None
+        relative = candidate[len(www_dir) + 1 :].replace(os.sep, "/")
+        return f"/local/{relative}", None
 
 
 class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
@@ -636,7 +678,39 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
         self._entry = entry
         # Initialize with existing data to preserve all options
         self._data: dict[str, Any] = {**entry.data, **(entry.options or {})}
+        # Own the exception lists so edits never mutate the live entry options
+        for key in (CONF_EXCEPTIONS_LIST, CONF_EXCEPTIONS_RECURRING):
+            if isinstance(self._data.get(key), list):
+                self._data[key] = list(self._data[key])
         self._selected_exception_id: str | None = None
+        # Rendered exception dropdowns, dropped whenever the matching list changes
+        self._exception_selectors: dict[str, selector.SelectSelector] = {}
+        self._bounds_cache: tuple[tuple[Any, ...], tuple[datetime | None, datetime | None]] | None = None
+
+    def _exception_bounds(self, item: dict[str, Any]) -> tuple[datetime | None, datetime | None]:
+        """Return the parsed start/end of a stored exception, memoized across re-renders."""
+        key = (item.get("id"), item.get("start"), item.get("end"))
+        if self._bounds_cache is None or self._bounds_cache[0] != key:
+            bounds = (_normalize_datetime(item.get("start")), _normalize_datetime(item.get("end")))
+            self._bounds_cache = (key, bounds)
+        return self._bounds_cache[1]
+
+    def _exception_selector(
+        self,
+        key: str,
+        exceptions: list[dict[str, Any]],
+        formatter: Callable[[dict[str, Any]], str],
+    ) -> selector.SelectSelector:
+        """Return the dropdown listing the exceptions stored under key."""
+        cached = self._exception_selectors.get(key)
+        if cached is None:
+            cached = self._exception_selectors[key] = selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[{"value": item.get("id", ""), "label": formatter(item)} for item in exceptions],
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            )
+        return cached
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Show options menu."""
@@ -654,46 +728,14 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
     async def async_step_custody(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Modify garde classique (custody type, reference year, and start day)."""
         if user_input:
-            cleaned = dict(user_input)
             # For alternate_weekend/alternate_week_parity, start_day is not used (based on ISO week parity)
-            self._data.update(cleaned)
-            if cleaned[CONF_CUSTODY_TYPE] == "custom":
+            self._data.update(user_input)
+            if user_input[CONF_CUSTODY_TYPE] == "custom":
                 return await self.async_step_custom_pattern()
             return self.async_create_entry(title="", data=self._data)
 
-        data = {**self._entry.data, **(self._entry.options or {})}
-        custody_type = data.get(CONF_CUSTODY_TYPE, "alternate_week")
-        # start_day is only relevant for custody types that use cycles (not alternate_weekend/alternate_week_parity)
-        show_start_day = custody_type not in ("alternate_weekend", "alternate_week_parity")
-        
-        reference_year_default = data.get(
-            CONF_REFERENCE_YEAR_CUSTODY, data.get(CONF_REFERENCE_YEAR, "even")
-        )
-        schema_dict = {
-            vol.Required(
-                CONF_CUSTODY_TYPE, default=custody_type
-            ): _custody_type_selector(),
-            # Unified label for reference year
-            vol.Required(
-                CONF_REFERENCE_YEAR_CUSTODY, default=reference_year_default
-            ): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=[
-                        {"value": "even", "label": "Je l'ai les années paires"},
-                        {"value": "odd", "label": "Je l'ai les années impaires"},
-                    ],
-                    mode=selector.SelectSelectorMode.LIST,
-                )
-            ),
-        }
-        
-        # Only show start_day for custody types that use it
-        if show_start_day:
-            schema_dict[vol.Required(
-                CONF_START_DAY, default=data.get(CONF_START_DAY, "monday")
-            )] = _start_day_selector()
-        
-        schema = vol.Schema(schema_dict)
+        # Times and location have their own "schedule" step in the options flow
+        schema = _custody_form_schema(self, self._data, include_times=False)
         return self.async_show_form(
             step_id="custody", 
             data_schema=schema,
@@ -713,11 +755,10 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
         schema_dict = {}
         # Get existing pattern if any
         existing = (self._data.get(CONF_CUSTOM_PATTERN) or "").split(",")
-        weekdays = ["Lun", "Mar", "Mer", "Jeu", "Ven", "Sam", "Dim"]
         for i in range(1, 15):
             week_num = 1 if i <= 7 else 2
             day_idx = (i - 1) % 7
-            label = f"S{week_num} - {weekdays[day_idx]}"
+            label = f"S{week_num} - {_WEEKDAY_SHORT_LABELS[day_idx]}"
             default = existing[i-1] == "on" if len(existing) >= i else False
             schema_dict[vol.Optional(f"day_{i}", default=default)] = selector.BooleanSelector()
             
@@ -729,24 +770,17 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
     async def async_step_schedule(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Modify schedule times and location."""
         if user_input:
-            cleaned = dict(user_input)
-            cleaned[CONF_ARRIVAL_TIME] = _time_to_str(user_input.get(CONF_ARRIVAL_TIME), "08:00")
-            cleaned[CONF_DEPARTURE_TIME] = _time_to_str(user_input.get(CONF_DEPARTURE_TIME), "19:00")
-            self._data.update(cleaned)
+            user_input[CONF_ARRIVAL_TIME] = _time_to_str(
+                user_input.get(CONF_ARRIVAL_TIME), _FIELD_DEFAULTS[CONF_ARRIVAL_TIME]
+            )
+            user_input[CONF_DEPARTURE_TIME] = _time_to_str(
+                user_input.get(CONF_DEPARTURE_TIME), _FIELD_DEFAULTS[CONF_DEPARTURE_TIME]
+            )
+            self._data.update(user_input)
             return self.async_create_entry(title="", data=self._data)
 
-        data = {**self._entry.data, **(self._entry.options or {})}
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_ARRIVAL_TIME, default=data.get(CONF_ARRIVAL_TIME, "08:00")
-                ): selector.TimeSelector(),
-                vol.Required(
-                    CONF_DEPARTURE_TIME, default=data.get(CONF_DEPARTURE_TIME, "19:00")
-                ): selector.TimeSelector(),
-                vol.Optional(CONF_LOCATION, default=data.get(CONF_LOCATION, "")): cv.string,
-            }
-        )
+        data = self._data
+        schema = self.add_suggested_values_to_schema(_SCHEDULE_SCHEMA, data)
         return self.async_show_form(step_id="schedule", data_schema=schema)
 
     async def async_step_exceptions(self, user_input: dict[str, Any] | None = None) -> FlowResult:
@@ -783,16 +817,10 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
                 exceptions = _get_exceptions(self._data)
                 exceptions.append(new_item)
                 self._data[CONF_EXCEPTIONS_LIST] = exceptions
+                self._exception_selectors.pop(CONF_EXCEPTIONS_LIST, None)
                 return self.async_create_entry(title="", data=self._data)
 
-        schema = vol.Schema(
-            {
-                vol.Optional("label"): cv.string,
-                vol.Required("start"): selector.DateTimeSelector(),
-                vol.Required("end"): selector.DateTimeSelector(),
-            }
-        )
-        return self.async_show_form(step_id="exceptions_add", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="exceptions_add", data_schema=_EXCEPTIONS_ADD_SCHEMA, errors=errors)
 
     async def async_step_exceptions_edit(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Select an exception to edit."""
@@ -800,7 +828,7 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
         if not exceptions:
             return self.async_show_form(
                 step_id="exceptions_edit",
-                data_schema=vol.Schema({}),
+                data_schema=_EMPTY_SCHEMA,
                 errors={"base": "no_exceptions"},
             )
 
@@ -810,17 +838,8 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
 
         schema = vol.Schema(
             {
-                vol.Required("exception_id"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {
-                                "value": item.get("id", ""),
-                                "label": _format_exception_label(item),
-                            }
-                            for item in exceptions
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
+                vol.Required("exception_id"): self._exception_selector(
+                    CONF_EXCEPTIONS_LIST, exceptions, _format_exception_label
                 )
             }
         )
@@ -830,27 +849,37 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
         """Edit the selected exception."""
         errors: dict[str, str] = {}
         exceptions = _get_exceptions(self._data)
-        selected = next((item for item in exceptions if item.get("id") == self._selected_exception_id), None)
-        if not selected:
+        index = _find_exception(exceptions, self._selected_exception_id)
+        if index is None:
             return await self.async_step_exceptions_edit()
+        selected = exceptions[index]
 
+        start = end = None
         if user_input:
             start = _normalize_datetime(user_input.get("start"))
             end = _normalize_datetime(user_input.get("end"))
             if not start or not end or end <= start:
                 errors["base"] = "end_before_start"
             if not errors:
-                selected["label"] = str(user_input.get("label") or selected.get("label") or "Exception").strip()
-                selected["start"] = start.isoformat()
-                selected["end"] = end.isoformat()
-                self._data[CONF_EXCEPTIONS_LIST] = exceptions
+                # Replace the item rather than mutating it: the dict is shared with the entry options
+                exceptions[index] = {
+                    **selected,
+                    "label": str(user_input.get("label") or selected.get("label") or "Exception").strip(),
+                    "start": start.isoformat(),
+                    "end": end.isoformat(),
+                }
+                self._exception_selectors.pop(CONF_EXCEPTIONS_LIST, None)
                 return self.async_create_entry(title="", data=self._data)
 
+        # Redisplay what the user just submitted, falling back to the stored bounds
+        label = (user_input or {}).get("label") or selected.get("label", "")
+        if start is None or end is None:
+            start, end = self._exception_bounds(selected)
         schema = vol.Schema(
             {
-                vol.Optional("label", default=selected.get("label", "")): cv.string,
-                vol.Required("start", default=_normalize_datetime(selected.get("start"))): selector.DateTimeSelector(),
-                vol.Required("end", default=_normalize_datetime(selected.get("end"))): selector.DateTimeSelector(),
+                vol.Optional("label", default=label): cv.string,
+                vol.Required("start", default=start): selector.DateTimeSelector(),
+                vol.Required("end", default=end): selector.DateTimeSelector(),
             }
         )
         return self.async_show_form(step_id="exceptions_edit_form", data_schema=schema, errors=errors)
@@ -861,30 +890,21 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
         if not exceptions:
             return self.async_show_form(
                 step_id="exceptions_delete",
-                data_schema=vol.Schema({}),
+                data_schema=_EMPTY_SCHEMA,
                 errors={"base": "no_exceptions"},
             )
 
         if user_input:
-            exception_id = user_input.get("exception_id")
-            self._data[CONF_EXCEPTIONS_LIST] = [
-                item for item in exceptions if item.get("id") != exception_id
-            ]
+            index = _find_exception(exceptions, user_input.get("exception_id"))
+            if index is not None:
+                del exceptions[index]
+                self._exception_selectors.pop(CONF_EXCEPTIONS_LIST, None)
             return self.async_create_entry(title="", data=self._data)
 
         schema = vol.Schema(
             {
-                vol.Required("exception_id"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {
-                                "value": item.get("id", ""),
-                                "label": _format_exception_label(item),
-                            }
-                            for item in exceptions
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
+                vol.Required("exception_id"): self._exception_selector(
+                    CONF_EXCEPTIONS_LIST, exceptions, _format_exception_label
                 )
             }
         )
@@ -917,33 +937,11 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
                 exceptions = _get_recurring_exceptions(self._data)
                 exceptions.append(new_item)
                 self._data[CONF_EXCEPTIONS_RECURRING] = exceptions
+                self._exception_selectors.pop(CONF_EXCEPTIONS_RECURRING, None)
                 return self.async_create_entry(title="", data=self._data)
 
-        schema = vol.Schema(
-            {
-                vol.Optional("label"): cv.string,
-                vol.Required("weekday"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": "0", "label": "Lundi"},
-                            {"value": "1", "label": "Mardi"},
-                            {"value": "2", "label": "Mercredi"},
-                            {"value": "3", "label": "Jeudi"},
-                            {"value": "4", "label": "Vendredi"},
-                            {"value": "5", "label": "Samedi"},
-                            {"value": "6", "label": "Dimanche"},
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Required("start_time"): selector.TimeSelector(),
-                vol.Required("end_time"): selector.TimeSelector(),
-                vol.Optional("start_date"): selector.DateSelector(),
-                vol.Optional("end_date"): selector.DateSelector(),
-            }
-        )
         return self.async_show_form(
-            step_id="exceptions_recurring_add", data_schema=schema, errors=errors
+            step_id="exceptions_recurring_add", data_schema=_EXCEPTIONS_RECURRING_ADD_SCHEMA, errors=errors
         )
 
     async def async_step_exceptions_recurring_edit(
@@ -954,7 +952,7 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
         if not exceptions:
             return self.async_show_form(
                 step_id="exceptions_recurring_edit",
-                data_schema=vol.Schema({}),
+                data_schema=_EMPTY_SCHEMA,
                 errors={"base": "no_exceptions"},
             )
 
@@ -964,17 +962,8 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
 
         schema = vol.Schema(
             {
-                vol.Required("exception_id"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {
-                                "value": item.get("id", ""),
-                                "label": _format_recurring_label(item),
-                            }
-                            for item in exceptions
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
+                vol.Required("exception_id"): self._exception_selector(
+                    CONF_EXCEPTIONS_RECURRING, exceptions, _format_recurring_label
                 )
             }
         )
@@ -986,9 +975,10 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
         """Edit the selected recurring exception."""
         errors: dict[str, str] = {}
         exceptions = _get_recurring_exceptions(self._data)
-        selected = next((item for item in exceptions if item.get("id") == self._selected_exception_id), None)
-        if not selected:
+        index = _find_exception(exceptions, self._selected_exception_id)
+        if index is None:
             return await self.async_step_exceptions_recurring_edit()
+        selected = exceptions[index]
 
         if user_input:
             start_time = _normalize_time(user_input.get("start_time"))
@@ -999,35 +989,28 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
             if weekday is None:
                 errors["base"] = "invalid_weekday"
             if not errors:
-                selected["label"] = str(user_input.get("label") or selected.get("label") or "Exception").strip()
-                selected["weekday"] = weekday
-                selected["start_time"] = start_time.strftime("%H:%M")
-                selected["end_time"] = end_time.strftime("%H:%M")
-                selected["start_date"] = _date_to_str(user_input.get("start_date"))
-                selected["end_date"] = _date_to_str(user_input.get("end_date"))
-                self._data[CONF_EXCEPTIONS_RECURRING] = exceptions
+                # Replace the item rather than mutating it: the dict is shared with the entry options
+                exceptions[index] = {
+                    **selected,
+                    "label": str(user_input.get("label") or selected.get("label") or "Exception").strip(),
+                    "weekday": weekday,
+                    "start_time": start_time.strftime("%H:%M"),
+                    "end_time": end_time.strftime("%H:%M"),
+                    "start_date": _date_to_str(user_input.get("start_date")),
+                    "end_date": _date_to_str(user_input.get("end_date")),
+                }
+                self._exception_selectors.pop(CONF_EXCEPTIONS_RECURRING, None)
                 return self.async_create_entry(title="", data=self._data)
 
+        default_start_time = _normalize_time(selected.get("start_time"))
+        default_start_date = _normalize_date(selected.get("start_date"))
         schema = vol.Schema(
             {
                 vol.Optional("label", default=selected.get("label", "")): cv.string,
-                vol.Required("weekday", default=str(selected.get("weekday", 0))): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": "0", "label": "Lundi"},
-                            {"value": "1", "label": "Mardi"},
-                            {"value": "2", "label": "Mercredi"},
-                            {"value": "3", "label": "Jeudi"},
-                            {"value": "4", "label": "Vendredi"},
-                            {"value": "5", "label": "Samedi"},
-                            {"value": "6", "label": "Dimanche"},
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Required("start_time", default=_normalize_time(selected.get("start_time"))): selector.TimeSelector(),
+                vol.Required("weekday", default=str(selected.get("weekday", 0))): _WEEKDAY_SELECTOR,
+                vol.Required("start_time", default=default_start_time): selector.TimeSelector(),
                 vol.Required("end_time", default=_normalize_time(selected.get("end_time"))): selector.TimeSelector(),
-                vol.Optional("start_date", default=_normalize_date(selected.get("start_date"))): selector.DateSelector(),
+                vol.Optional("start_date", default=default_start_date): selector.DateSelector(),
                 vol.Optional("end_date", default=_normalize_date(selected.get("end_date"))): selector.DateSelector(),
             }
         )
@@ -1043,30 +1026,21 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
         if not exceptions:
             return self.async_show_form(
                 step_id="exceptions_recurring_delete",
-                data_schema=vol.Schema({}),
+                data_schema=_EMPTY_SCHEMA,
                 errors={"base": "no_exceptions"},
             )
 
         if user_input:
-            exception_id = user_input.get("exception_id")
-            self._data[CONF_EXCEPTIONS_RECURRING] = [
-                item for item in exceptions if item.get("id") != exception_id
-            ]
+            index = _find_exception(exceptions, user_input.get("exception_id"))
+            if index is not None:
+                del exceptions[index]
+                self._exception_selectors.pop(CONF_EXCEPTIONS_RECURRING, None)
             return self.async_create_entry(title="", data=self._data)
 
         schema = vol.Schema(
             {
-                vol.Required("exception_id"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {
-                                "value": item.get("id", ""),
-                                "label": _format_recurring_label(item),
-                            }
-                            for item in exceptions
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
+                vol.Required("exception_id"): self._exception_selector(
+                    CONF_EXCEPTIONS_RECURRING, exceptions, _format_recurring_label
                 )
             }
         )
@@ -1078,120 +1052,25 @@ class CustodyScheduleOptionsFlow(config_entries.OptionsFlow):
             self._data.update(user_input)
             return self.async_create_entry(title="", data=self._data)
 
-        data = {**self._entry.data, **(self._entry.options or {})}
-        # Get reference_year for vacations (separate from custody reference_year)
-        reference_year_default = data.get(
-            CONF_REFERENCE_YEAR_VACATIONS, data.get(CONF_REFERENCE_YEAR, "even")
-        )
-        vacation_split_default = data.get(CONF_VACATION_SPLIT_MODE, "odd_first")
-        
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_ZONE, default=data.get(CONF_ZONE, "A")): _zone_selector(),
-                vol.Optional(
-                    CONF_SCHOOL_LEVEL, default=data.get(CONF_SCHOOL_LEVEL, "primary")
-                ): _school_level_selector(),
-                vol.Required(CONF_VACATION_SPLIT_MODE, default=vacation_split_default): _vacation_split_selector(),
-                vol.Required(
-                    CONF_SUMMER_SPLIT_MODE, default=data.get(CONF_SUMMER_SPLIT_MODE, "half")
-                ): _summer_split_selector(),
-                vol.Optional(
-                    CONF_ALSACE_MOSELLE, default=data.get(CONF_ALSACE_MOSELLE, False)
-                ): selector.BooleanSelector(),
-                vol.Required(
-                    CONF_PARENTAL_ROLE, default=data.get(CONF_PARENTAL_ROLE, "none")
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": "none", "label": "Aucun (Désactivé)"},
-                            {"value": "father", "label": "Papa"},
-                            {"value": "mother", "label": "Maman"},
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Optional(
-                    CONF_AUTO_PARENT_DAYS, default=data.get(CONF_AUTO_PARENT_DAYS, True)
-                ): selector.BooleanSelector(),
-            }
-        )
+        schema = self.add_suggested_values_to_schema(_VACATIONS_SCHEMA, self._data)
         return self.async_show_form(step_id="vacations", data_schema=schema)
 
     async def async_step_advanced(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Advanced optional settings."""
         if user_input:
-            cleaned = dict(user_input)
-            errors: dict[str, str] = {}
-            calendar_sync = cleaned.get(CONF_CALENDAR_SYNC, False)
-            calendar_target = cleaned.get(CONF_CALENDAR_TARGET, "") or ""
-            if calendar_sync and not str(calendar_target).strip():
-                errors[CONF_CALENDAR_TARGET] = "calendar_target_required"
-
-            # Validate API URL if provided
-            api_url = cleaned.get(CONF_HOLIDAY_API_URL)
-            if api_url and api_url.strip():
-                # Basic validation: must contain {year} and {zone} placeholders
-                if "{year}" not in api_url or "{zone}" not in api_url:
-                    # Merge user input with existing data to preserve user's entry
-                    data = {**self._entry.data, **(self._entry.options or {})}
-                    merged_data = {**data, **cleaned}
-                    return self.async_show_form(
-                        step_id="advanced",
-                        data_schema=self._get_advanced_schema(merged_data),
-                        errors={**errors, CONF_HOLIDAY_API_URL: "api_url_missing_placeholders"},
-                    )
-                cleaned[CONF_HOLIDAY_API_URL] = api_url.strip()
-            else:
-                cleaned.pop(CONF_HOLIDAY_API_URL, None)
+            errors = _validate_advanced_input(user_input)
             if errors:
-                data = {**self._entry.data, **(self._entry.options or {})}
-                merged_data = {**data, **cleaned}
-                return self.async_show_form(
-                    step_id="advanced",
-                    data_schema=self._get_advanced_schema(merged_data),
-                    errors=errors,
-                )
-            self._data.update(cleaned)
+                return self._advanced_error_form(user_input, errors)
+            self._data.update(user_input)
             return self.async_create_entry(title="", data=self._data)
 
-        data = {**self._entry.data, **(self._entry.options or {})}
-        return self.async_show_form(step_id="advanced", data_schema=self._get_advanced_schema(data))
+        schema = self.add_suggested_values_to_schema(_ADVANCED_SCHEMA, self._data)
+        return self.async_show_form(step_id="advanced", data_schema=schema)
 
-    def _get_advanced_schema(self, data: dict[str, Any] | None = None) -> vol.Schema:
-        """Get the advanced settings schema."""
-        if data is None:
-            data = {}
-        return vol.Schema(
-            {
-                vol.Optional(CONF_NOTES, default=data.get(CONF_NOTES, "")): cv.string,
-                vol.Optional(CONF_NOTIFICATIONS, default=data.get(CONF_NOTIFICATIONS, False)): cv.boolean,
-                vol.Optional(CONF_CALENDAR_SYNC, default=data.get(CONF_CALENDAR_SYNC, False)): cv.boolean,
-                vol.Optional(
-                    CONF_CALENDAR_TARGET,
-                    default=data.get(CONF_CALENDAR_TARGET, ""),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="calendar")
-                ),
-                vol.Optional(
-                    CONF_CALENDAR_SYNC_DAYS,
-                    default=data.get(CONF_CALENDAR_SYNC_DAYS, 120),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=7, max=365, mode=selector.NumberSelectorMode.BOX, step=1
-                    )
-                ),
-                vol.Optional(
-                    CONF_CALENDAR_SYNC_INTERVAL_HOURS,
-                    default=data.get(CONF_CALENDAR_SYNC_INTERVAL_HOURS, 1),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1, max=24, mode=selector.NumberSelectorMode.BOX, step=1
-                    )
-                ),
-                vol.Optional(
-                    CONF_HOLIDAY_API_URL,
-                    default=data.get(CONF_HOLIDAY_API_URL, ""),
-                    description={"suggested_value": HOLIDAY_API},
-                ): cv.string,
-            }
+    def _advanced_error_form(self, cleaned: dict[str, Any], errors: dict[str, str]) -> FlowResult:
+        """Show the advanced form again, keeping the user's entries."""
+        return self.async_show_form(
+            step_id="advanced",
+            data_schema=self.add_suggested_values_to_schema(_ADVANCED_SCHEMA, ChainMap(cleaned, self._data)),
+            errors=errors,
         )
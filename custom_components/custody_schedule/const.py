@@ -121,6 +121,8 @@ CUSTODY_TYPES = {
         "pattern": [],
     },
 }
+# Stable display order for custody type pickers
+CUSTODY_TYPE_KEYS_SORTED = tuple(sorted(CUSTODY_TYPES))
 
 ATTR_NEXT_ARRIVAL = "next_arrival"
 ATTR_NEXT_DEPARTURE = "next_departure"
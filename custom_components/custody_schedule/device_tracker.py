@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from homeassistant.components.device_tracker import TrackerEntity
+from homeassistant.components.device_tracker import SourceType, TrackerEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -48,6 +46,7 @@ class CustodyDeviceTracker(CoordinatorEntity[CustodyComputation], TrackerEntity)
         """Initialize the device tracker."""
         super().__init__(coordinator)
         self._entry = entry
+        self._child_name = child_name
         self._attr_name = f"{child_name} Suivi"
         self._attr_unique_id = f"{entry.entry_id}_device_tracker"
         self._attr_device_info = None
@@ -55,32 +54,36 @@ class CustodyDeviceTracker(CoordinatorEntity[CustodyComputation], TrackerEntity)
         photo = entry.data.get(CONF_PHOTO)
         if photo:
             self._attr_entity_picture = photo
+        self._update_from_data()
 
     @property
     def state(self) -> str:
         """Return the state of the device tracker."""
-        data = self.coordinator.data
-        if not data:
-            return "not_home"
-        
-        # Si l'enfant est en garde, il est "home"
-        # Sinon, il est "not_home"
-        return "home" if data.is_present else "not_home"
+        return self._attr_state
 
     @property
-    def source_type(self) -> str:
+    def source_type(self) -> SourceType:
         """Return the source type of the device tracker."""
-        return "gps"  # Utilisé pour les device trackers basés sur la logique
+        return SourceType.GPS  # Utilisé pour les device trackers basés sur la logique
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional metadata."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state and attributes, then write them."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
+
+    def _update_from_data(self) -> None:
+        """Derive state and attributes from the latest coordinator data."""
         data = self.coordinator.data
-        if not data:
-            return {}
-        
-        return {
-            "child_name": self._entry.data.get(CONF_CHILD_NAME_DISPLAY, self._entry.data.get(CONF_CHILD_NAME)),
+        if data is None:
+            self._attr_state = "not_home"
+            self._attr_extra_state_attributes = {}
+            return
+        # Si l'enfant est en garde, il est "home"
+        # Sinon, il est "not_home"
+        self._attr_state = "home" if data.is_present else "not_home"
+        self._attr_extra_state_attributes = {
+            "child_name": self._child_name,
             "source": "custody_schedule",
             "is_present": data.is_present,
         }
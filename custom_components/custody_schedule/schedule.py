@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, date, time, timedelta
+from functools import lru_cache
 from typing import Any, Iterable
 
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
 
+@lru_cache(maxsize=64)
 def _easter_date(year: int) -> date:
     """Calculate Easter Sunday date using the Anonymous Gregorian algorithm."""
     a = year % 19
@@ -29,7 +32,8 @@ def _easter_date(year: int) -> date:
     return date(year, month, day)
 
 
-def get_french_holidays(year: int, include_alsace_moselle: bool = False) -> set[date]:
+@lru_cache(maxsize=64)
+def get_french_holidays(year: int, include_alsace_moselle: bool = False) -> frozenset[date]:
     """Return set of French public holidays for a given year.
     
     Calculates all official French public holidays (jours fériés).
@@ -62,7 +66,42 @@ def get_french_holidays(year: int, include_alsace_moselle: bool = False) -> set[
     if include_alsace_moselle:
         holidays.add(easter - timedelta(days=2))  # Vendredi Saint
     
-    return holidays
+    return frozenset(holidays)
+
+
+@lru_cache(maxsize=32)
+def _holiday_ordinals(year: int, include_alsace_moselle: bool = False) -> frozenset[int]:
+    """Return ordinals of French public holidays for a year and the following one."""
+    return frozenset(
+        day.toordinal()
+        for day in get_french_holidays(year, include_alsace_moselle)
+        | get_french_holidays(year + 1, include_alsace_moselle)
+    )
+
+
+@lru_cache(maxsize=16)
+def _iso_week1_monday(year: int) -> int:
+    """Return the ordinal of the Monday that starts ISO week 1 of a year."""
+    jan4 = date(year, 1, 4)
+    return jan4.toordinal() - jan4.weekday()
+
+
+def _iso_week_parity(day: date) -> int:
+    """Return the ISO week number parity (0 even / 1 odd) of a date.
+
+    Equivalent to ``day.isocalendar().week % 2`` without building the tuple;
+    the ISO year is resolved per call so 53-week years keep the right parity.
+    """
+    ordinal = day.toordinal()
+    year = day.year
+    start = _iso_week1_monday(year)
+    if ordinal < start:
+        start = _iso_week1_monday(year - 1)
+    else:
+        next_start = _iso_week1_monday(year + 1)
+        if ordinal >= next_start:
+            start = next_start
+    return ((ordinal - start) // 7 + 1) & 1
 
 
 def get_parent_days(year: int) -> dict[str, date]:
@@ -82,22 +121,7 @@ def get_parent_days(year: int) -> dict[str, date]:
     mothers_day = last_may - timedelta(days=days_back_to_sunday)
     
     # Check for Pentecost (Easter + 49 days)
-    # Re-using logic to calculate Easter locally
-    a = year % 19
-    b = year // 100
-    c = year % 100
-    d = b // 4
-    e = b % 4
-    f = (b + 8) // 25
-    g = (b - f + 1) // 3
-    h = (19 * a + b - d - g + 15) % 30
-    i = c // 4
-    k = c % 4
-    l = (32 + 2 * e + 2 * i - h - k) % 7
-    m = (a + 11 * h + 22 * l) // 451
-    month = (h + l - 7 * m + 114) // 31
-    day = ((h + l - 7 * m + 114) % 31) + 1
-    easter_sunday = date(year, month, day)
+    easter_sunday = _easter_date(year)
     
     pentecost_sunday = easter_sunday + timedelta(days=49)
     if mothers_day == pentecost_sunday:
@@ -164,6 +188,34 @@ class CustodyComputation:
     attributes: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(frozen=True, slots=True)
+class PatternSpec:
+    """Day offsets, from the Monday of a matching ISO week, for a parity pattern.
+
+    A public holiday on ``early_holiday_offset`` moves the start to
+    ``early_start_offset``; one on ``late_holiday_offset`` moves the end to
+    ``late_end_offset``. Both together are labelled as a bridge ("Pont").
+    Holiday offsets must be non-negative (they index a per-call bitmap).
+    """
+
+    start_offset: int
+    end_offset: int
+    early_holiday_offset: int
+    early_start_offset: int
+    early_label: str
+    late_holiday_offset: int
+    late_end_offset: int
+    late_label: str
+
+
+PARITY_PATTERNS: dict[str, PatternSpec] = {
+    # Week-end : vendredi -> dimanche, jeudi si vendredi férié, lundi si lundi férié
+    "alternate_weekend": PatternSpec(4, 6, 4, 3, " + Vendredi férié", 7, 7, " + Lundi férié"),
+    # Semaine : lundi -> dimanche, vendredi précédent si lundi férié, lundi suivant si vendredi férié
+    "alternate_week_parity": PatternSpec(0, 6, 0, -3, " + Lundi férié", 4, 7, " + Vendredi férié"),
+}
+
+
 WEEKDAY_LOOKUP = {
     "monday": 0,
     "tuesday": 1,
@@ -188,12 +240,14 @@ class CustodyScheduleManager:
 
         self._arrival_time = self._parse_time(config.get(CONF_ARRIVAL_TIME, "08:00"))
         self._departure_time = self._parse_time(config.get(CONF_DEPARTURE_TIME, "19:00"))
+        self._recurring_parsed = self._parse_recurring_exceptions()
 
     def update_config(self, new_config: dict[str, Any]) -> None:
         """Update stored config (used when options change)."""
         self._config = {**self._config, **new_config}
         self._arrival_time = self._parse_time(self._config.get(CONF_ARRIVAL_TIME, "08:00"))
         self._departure_time = self._parse_time(self._config.get(CONF_DEPARTURE_TIME, "19:00"))
+        self._recurring_parsed = self._parse_recurring_exceptions()
 
     def set_manual_windows(self, ranges: Iterable[dict[str, Any]]) -> None:
         """Store manual presence windows defined via service."""
@@ -230,6 +284,8 @@ class CustodyScheduleManager:
         """Build the schedule state used by entities."""
         # now is already in local time (from dt_util.now()), no need to convert
         now_local = now if now.tzinfo else dt_util.as_local(now)
+        # Marge de 1 minute : une fenêtre qui se termine avant cutoff est considérée comme terminée
+        cutoff = now_local + timedelta(minutes=1)
         windows = await self._build_windows(now_local)
         windows.extend(self._manual_windows)
         windows.extend(self._build_recurring_windows(now_local))
@@ -238,27 +294,41 @@ class CustodyScheduleManager:
         # Conserver toutes les fenêtres pour l'affichage (historique)
         all_windows = list(windows)
 
-        # Filtrer STRICTEMENT les fenêtres qui se terminent dans le passé pour les CALCULS d'état
-        # Ne garder que les fenêtres qui se terminent APRÈS maintenant (pas égal, pas proche)
-        # Ajouter une marge de 1 minute pour éviter les problèmes de timing
-        windows = [w for w in windows if w.end > now_local + timedelta(minutes=1)]
-
+        # Un seul parcours des fenêtres triées pour les CALCULS d'état.
+        # Ignorer STRICTEMENT les fenêtres qui se terminent dans le passé : ne garder que celles
+        # qui se terminent APRÈS maintenant, avec une marge de 1 minute pour éviter les problèmes de timing
+        # first_window : première fenêtre encore active ou future
         # current_window : fenêtre qui commence avant ou à maintenant et se termine après maintenant
-        # Mais exclure les fenêtres qui se terminent dans moins d'1 minute (considérées comme terminées)
-        current_window = next(
-            (window for window in windows 
-             if window.start <= now_local < window.end and window.end > now_local + timedelta(minutes=1)), 
-            None
-        )
-        # next_window doit être une fenêtre qui commence dans le futur ET qui se termine dans le futur
-        next_window = next((window for window in windows if window.start > now_local and window.end > now_local), None)
+        # next_window : fenêtre qui commence dans le futur ET qui se termine dans le futur
+        # next_after_current : première fenêtre qui commence après la fin de current_window
+        first_window: CustodyWindow | None = None
+        current_window: CustodyWindow | None = None
+        next_window: CustodyWindow | None = None
+        next_after_current: CustodyWindow | None = None
+        for window in windows:
+            if window.end <= cutoff:
+                continue
+            if first_window is None:
+                first_window = window
+            if window.start <= now_local:
+                if current_window is None:
+                    current_window = window
+                continue
+            if next_window is None:
+                next_window = window
+            if current_window is None:
+                # Les fenêtres suivantes commencent toutes dans le futur
+                break
+            if window.start > current_window.end:
+                next_after_current = window
+                break
 
         override_state = self._evaluate_override(now_local)
         is_present = override_state if override_state is not None else current_window is not None
 
         # Si current_window existe mais se termine très bientôt (déjà filtré à la ligne 184, mais sécurité supplémentaire)
         # forcer is_present à False pour éviter d'afficher une date de départ dans le passé ou très proche
-        if current_window and current_window.end <= now_local + timedelta(minutes=1):
+        if current_window and current_window.end <= cutoff:
             # La fenêtre se termine dans moins d'1 minute, considérer que l'enfant n'est plus en garde
             if override_state is None:
                 is_present = False
@@ -272,37 +342,31 @@ class CustodyScheduleManager:
                 # On est dans une vraie fenêtre de garde
                 next_departure = current_window.end
                 # S'assurer que next_departure est dans le futur (avec une marge de 1 minute)
-                if next_departure and next_departure > now_local + timedelta(minutes=1):
-                    # Chercher la fenêtre qui commence après next_departure
-                    next_arrival = next((w.start for w in windows if w.start > next_departure), None)
+                if next_departure and next_departure > cutoff:
+                    # Fenêtre qui commence après next_departure
+                    next_arrival = next_after_current.start if next_after_current else None
                 else:
                     # Si la fin est dans le passé ou très proche, utiliser la prochaine fenêtre
                     next_departure = next_window.end if next_window else None
                     next_arrival = next_window.start if next_window else None
                     # Si on n'a pas de next_window, chercher la prochaine fenêtre future
-                    if not next_departure:
-                        next_departure = next((w.end for w in windows if w.end > now_local + timedelta(minutes=1)), None)
-                        if next_departure:
-                            matching_window = next((w for w in windows if w.end == next_departure), None)
-                            if matching_window:
-                                next_arrival = matching_window.start
+                    if not next_departure and first_window:
+                        next_departure = first_window.end
+                        next_arrival = first_window.start
             elif override_state is True and self._presence_override and self._presence_override.get("until"):
                 # Override avec une date de fin spécifiée
                 next_departure = self._presence_override["until"]
-                if next_departure > now_local + timedelta(minutes=1):
+                if next_departure > cutoff:
                     # Chercher la fenêtre qui commence après l'override
-                    next_arrival = next((w.start for w in windows if w.start > next_departure), None)
+                    next_arrival = next((w.start for w in all_windows if w.start > next_departure), None)
                 else:
                     # Override dans le passé ou très proche, utiliser la prochaine fenêtre
                     next_departure = next_window.end if next_window else None
                     next_arrival = next_window.start if next_window else None
                     # Si on n'a pas de next_window, chercher la prochaine fenêtre future
-                    if not next_departure:
-                        next_departure = next((w.end for w in windows if w.end > now_local + timedelta(minutes=1)), None)
-                        if next_departure:
-                            matching_window = next((w for w in windows if w.end == next_departure), None)
-                            if matching_window:
-                                next_arrival = matching_window.start
+                    if not next_departure and first_window:
+                        next_departure = first_window.end
+                        next_arrival = first_window.start
             else:
                 # Override sans date de fin ou cas spécial, utiliser la prochaine fenêtre
                 next_departure = next_window.end if next_window else None
@@ -315,16 +379,14 @@ class CustodyScheduleManager:
             
             # S'assurer que next_departure est toujours dans le futur (avec marge d'1 minute)
             # Normalement next_window.end devrait toujours être dans le futur, mais sécurité supplémentaire
-            if next_departure and next_departure <= now_local + timedelta(minutes=1):
-                # Si next_departure est dans le passé ou très proche, chercher la prochaine fenêtre après
-                next_departure = next((w.end for w in windows if w.end > now_local + timedelta(minutes=1)), None)
-                if next_departure:
-                    # Trouver la fenêtre correspondante pour next_arrival
-                    matching_window = next((w for w in windows if w.end == next_departure), None)
-                    if matching_window:
-                        next_arrival = matching_window.start
+            if next_departure and next_departure <= cutoff:
+                # Si next_departure est dans le passé ou très proche, prendre la prochaine fenêtre active
+                if first_window:
+                    next_departure = first_window.end
+                    next_arrival = first_window.start
                 else:
                     # Si aucune fenêtre future, next_arrival devrait aussi être None
+                    next_departure = None
                     next_arrival = None
 
         days_remaining = None
@@ -439,16 +501,15 @@ class CustodyScheduleManager:
                 
         return windows
 
-    def _build_recurring_windows(self, now: datetime) -> list[CustodyWindow]:
-        """Generate recurring exception windows."""
+    def _parse_recurring_exceptions(
+        self,
+    ) -> list[tuple[int, time, time, date | None, date | None, str]]:
+        """Validate and parse recurring exceptions once per config change."""
         exceptions = self._config.get(CONF_EXCEPTIONS_RECURRING, [])
         if not isinstance(exceptions, list) or not exceptions:
             return []
 
-        windows: list[CustodyWindow] = []
-        horizon_end = now.date() + timedelta(days=365)
-        range_start = now.date() - timedelta(days=365)
-
+        parsed: list[tuple[int, time, time, date | None, date | None, str]] = []
         for item in exceptions:
             try:
                 weekday = int(item.get("weekday"))
@@ -464,7 +525,23 @@ class CustodyScheduleManager:
 
             start_date = dt_util.parse_date(item.get("start_date")) if item.get("start_date") else None
             end_date = dt_util.parse_date(item.get("end_date")) if item.get("end_date") else None
+            label = item.get("label") or "Exception récurrente"
+            parsed.append((weekday, start_time, end_time, start_date, end_date, label))
+        return parsed
+
+    def _build_recurring_windows(self, now: datetime) -> list[CustodyWindow]:
+        """Generate recurring exception windows."""
+        if not self._recurring_parsed:
+            return []
+
+        windows: list[CustodyWindow] = []
+        horizon_end = now.date() + timedelta(days=365)
+        range_start = now.date() - timedelta(days=365)
+        tz = self._tz
+        combine = datetime.combine
+        one_week = timedelta(days=7)
 
+        for weekday, start_time, end_time, start_date, end_date, label in self._recurring_parsed:
             current = max(range_start, start_date) if start_date else range_start
             range_end = min(horizon_end, end_date) if end_date else horizon_end
             if current > range_end:
@@ -472,11 +549,10 @@ class CustodyScheduleManager:
 
             days_ahead = (weekday - current.weekday()) % 7
             occ_date = current + timedelta(days=days_ahead)
-            label = item.get("label") or "Exception récurrente"
 
             while occ_date <= range_end:
-                start_dt = datetime.combine(occ_date, start_time, tzinfo=self._tz)
-                end_dt = datetime.combine(occ_date, end_time, tzinfo=self._tz)
+                start_dt = combine(occ_date, start_time, tz)
+                end_dt = combine(occ_date, end_time, tz)
                 if end_dt > start_dt:
                     windows.append(
                         CustodyWindow(
@@ -486,7 +562,7 @@ class CustodyScheduleManager:
                             source="exception_recurring",
                         )
                     )
-                occ_date += timedelta(days=7)
+                occ_date += one_week
 
         return windows
     
@@ -501,59 +577,74 @@ class CustodyScheduleManager:
         if not vacation_windows:
             return pattern_windows
         
-        # Build a list of priority periods (start, end) for quick overlap checking.
-        vacation_periods = [(vw.start, vw.end) for vw in vacation_windows if vw.source == "vacation_filter"]
-        if not vacation_periods:
+        # Build sorted, disjoint priority periods so each window needs a single bisect.
+        priority_windows = [vw for vw in vacation_windows if vw.source == "vacation_filter"]
+        if not priority_windows:
             # Fallback to display windows if no filter windows (should not happen for vacations)
-            vacation_periods = [(vw.start, vw.end) for vw in vacation_windows]
+            priority_windows = vacation_windows
+        starts, ends = self._merge_vacation_periods(priority_windows)
+        period_count = len(starts)
         
-        # Process each priority period one by one, subtracting from the set of pattern windows
-        current_active_windows = list(pattern_windows)
-        
-        for vac_start, vac_end in vacation_periods:
-            next_pass_windows = []
-            for item in current_active_windows:
-                # 1. No overlap at all? Keep the window as is.
-                if item.start >= vac_end or item.end <= vac_start:
-                    next_pass_windows.append(item)
-                    continue
-                
-                # 2. Partials overlaps - Subtract the overlapping range
-                # Handle the part before the vacation segment
-                if item.start < vac_start:
-                    next_pass_windows.append(
-                        CustodyWindow(item.start, vac_start, item.label, item.source)
-                    )
-                
-                # Handle the part after the vacation segment
-                if item.end > vac_end:
-                    next_pass_windows.append(
-                        CustodyWindow(vac_end, item.end, item.label, item.source)
-                    )
-                    
-            current_active_windows = next_pass_windows
+        filtered: list[CustodyWindow] = []
+        for item in pattern_windows:
+            # First period ending after the window starts; earlier ones cannot overlap.
+            idx = bisect_right(ends, item.start)
+            # 1. No overlap at all? Keep the window as is.
+            if idx == period_count or starts[idx] >= item.end:
+                filtered.append(item)
+                continue
+            
+            # 2. Partial overlaps - Subtract every overlapping range, keeping the gaps
+            cursor = item.start
+            while idx < period_count and starts[idx] < item.end:
+                if cursor < starts[idx]:
+                    filtered.append(CustodyWindow(cursor, starts[idx], item.label, item.source))
+                cursor = max(cursor, ends[idx])
+                idx += 1
+            if cursor < item.end:
+                filtered.append(CustodyWindow(cursor, item.end, item.label, item.source))
             
-        return current_active_windows
+        return filtered
 
-    def _is_in_vacation_period(self, check_date: datetime, vacation_windows: list[CustodyWindow]) -> bool:
+    @staticmethod
+    def _merge_vacation_periods(
+        vacation_windows: list[CustodyWindow],
+    ) -> tuple[list[datetime], list[datetime]]:
+        """Merge vacation windows into sorted, disjoint (starts, ends) lists.
+
+        Filter windows cover whole vacations and overlap the display windows
+        inside them, so overlapping or touching periods are coalesced first.
+        """
+        starts: list[datetime] = []
+        ends: list[datetime] = []
+        for window in sorted(vacation_windows, key=lambda w: w.start):
+            if ends and window.start <= ends[-1]:
+                if window.end > ends[-1]:
+                    ends[-1] = window.end
+                continue
+            starts.append(window.start)
+            ends.append(window.end)
+        return starts, ends
+
+    def _is_in_vacation_period(
+        self, check_date: datetime, vacation_periods: tuple[list[datetime], list[datetime]]
+    ) -> bool:
         """Check if a date falls within any vacation period.
         
         Args:
             check_date: Date to check
-            vacation_windows: List of vacation windows (including filter windows)
+            vacation_periods: Merged (starts, ends) from _merge_vacation_periods
         
         Returns:
             True if the date is within a vacation period, False otherwise
         """
-        if not vacation_windows:
-            return False
-        
-        for vac_window in vacation_windows:
-            if vac_window.start <= check_date <= vac_window.end:
-                return True
-        return False
+        starts, ends = vacation_periods
+        i = bisect_right(starts, check_date) - 1
+        return i >= 0 and check_date <= ends[i]
 
-    def _generate_pattern_windows(self, now: datetime, vacation_windows: list[CustodyWindow] = None) -> list[CustodyWindow]:
+    def _generate_pattern_windows(
+        self, now: datetime, vacation_windows: list[CustodyWindow] | None = None
+    ) -> list[CustodyWindow]:
         """Create repeating windows from the selected custody type.
         
         Args:
@@ -568,164 +659,12 @@ class CustodyScheduleManager:
         # Use a longer horizon (400 days) to support 365-day calendar sync
         horizon = now + timedelta(days=400)
 
-        # Cas particulier : week-ends basés sur la parité ISO des semaines
-        if custody_type == "alternate_weekend":
-            windows: list[CustodyWindow] = []
-            pointer = self._reference_start(now, custody_type)
-            
-            # Get French holidays for current and next year
-            alsace_moselle = self._config.get(CONF_ALSACE_MOSELLE, False)
-            holidays = get_french_holidays(now.year, alsace_moselle) | get_french_holidays(now.year + 1, alsace_moselle)
-            
-            # Get reference_year to determine parity (even = even weeks, odd = odd weeks)
-            reference_year = self._config.get(
-                CONF_REFERENCE_YEAR_CUSTODY, self._config.get(CONF_REFERENCE_YEAR, "even")
-            )
-            target_parity = 0 if reference_year == "even" else 1  # 0 = even, 1 = odd
-            
-            # Ajuster le pointer pour commencer avant ou à la date actuelle
-            # Si le pointer est trop loin dans le passé, avancer jusqu'à une semaine proche de maintenant
-            # On avance de 2 semaines à la fois pour respecter l'alternance
-            while pointer < now - timedelta(days=365):
-                old_pointer = pointer
-                pointer += timedelta(days=14)  # Sauter 2 semaines (alternance)
-                # Vérifier que le pointer a toujours la bonne parité
-                if pointer.isocalendar()[1] % 2 != target_parity:
-                    # Si on a perdu la parité, ajuster d'une semaine
-                    pointer += timedelta(days=7)
-            
-            while pointer < horizon:
-                iso_week = pointer.isocalendar().week
-                week_parity = iso_week % 2  # 0 = even, 1 = odd
-                if week_parity == target_parity:
-                    # Weekend: Friday 16:15 -> Sunday 19:00
-                    # pointer is Monday of the week, so:
-                    # Friday = pointer + 4, Saturday = pointer + 5, Sunday = pointer + 6
-                    friday = pointer + timedelta(days=4)
-                    sunday = pointer + timedelta(days=6)
-                    monday = pointer + timedelta(days=7)
-                    thursday = pointer + timedelta(days=3)
-                    
-                    # Default start/end
-                    window_start = friday
-                    window_end = sunday
-                    label_suffix = ""
-                    
-                    # Check if weekend falls during vacation period
-                    # If yes, don't apply public holiday extensions (vacations dominate)
-                    weekend_in_vacation = (
-                        self._is_in_vacation_period(friday, vacation_windows) or
-                        self._is_in_vacation_period(sunday, vacation_windows) or
-                        self._is_in_vacation_period(monday, vacation_windows)
-                    )
-                    
-                    # Only apply public holidays if NOT during vacation period
-                    if not weekend_in_vacation:
-                        friday_is_holiday = friday.date() in holidays
-                        monday_is_holiday = monday.date() in holidays
-                        
-                        if friday_is_holiday:
-                            # Vendredi férié: start Thursday instead
-                            window_start = thursday
-                            label_suffix = " + Vendredi férié"
-                        
-                        if monday_is_holiday:
-                            # Lundi férié: extend to Monday
-                            window_end = monday
-                            label_suffix = " + Lundi férié" if not label_suffix else " + Pont"
-                    
-                    # Get label from custody type definition
-                    type_label = CUSTODY_TYPES.get(custody_type, {}).get("label", "Garde")
-                    windows.append(
-                        CustodyWindow(
-                            start=self._apply_time(window_start, self._arrival_time),
-                            end=self._apply_time(window_end, self._departure_time),
-                            label=f"Garde - {type_label}{label_suffix}",
-                            source="pattern",
-                        )
-                    )
-                pointer += timedelta(days=7)
-            return windows
-
-        # Cas particulier : semaines alternées basées sur la parité ISO des semaines
-        if custody_type == "alternate_week_parity":
-            windows: list[CustodyWindow] = []
-            pointer = self._reference_start(now, custody_type)
-            
-            # Get French holidays for current and next year
-            alsace_moselle = self._config.get(CONF_ALSACE_MOSELLE, False)
-            holidays = get_french_holidays(now.year, alsace_moselle) | get_french_holidays(now.year + 1, alsace_moselle)
-            
-            # Get reference_year to determine parity (even = even weeks, odd = odd weeks)
-            reference_year = self._config.get(
-                CONF_REFERENCE_YEAR_CUSTODY, self._config.get(CONF_REFERENCE_YEAR, "even")
+        # Cas particulier : week-ends / semaines basés sur la parité ISO des semaines
+        spec = PARITY_PATTERNS.get(custody_type)
+        if spec is not None:
+            return self._generate_parity_windows(
+                now, horizon, custody_type, spec, self._merge_vacation_periods(vacation_windows)
             )
-            target_parity = 0 if reference_year == "even" else 1  # 0 = even, 1 = odd
-            
-            # Ajuster le pointer pour commencer avant ou à la date actuelle
-            # Si le pointer est trop loin dans le passé, avancer jusqu'à une semaine proche de maintenant
-            # On avance de 2 semaines à la fois pour respecter l'alternance
-            while pointer < now - timedelta(days=365):
-                old_pointer = pointer
-                pointer += timedelta(days=14)  # Sauter 2 semaines (alternance)
-                # Vérifier que le pointer a toujours la bonne parité
-                if pointer.isocalendar()[1] % 2 != target_parity:
-                    # Si on a perdu la parité, ajuster d'une semaine
-                    pointer += timedelta(days=7)
-            
-            while pointer < horizon:
-                iso_week = pointer.isocalendar().week
-                week_parity = iso_week % 2  # 0 = even, 1 = odd
-                if week_parity == target_parity:
-                    # Week: Monday to Sunday (7 days)
-                    monday = pointer
-                    sunday = pointer + timedelta(days=6)
-                    next_monday = pointer + timedelta(days=7)
-                    previous_friday = pointer - timedelta(days=3)
-                    
-                    # Default start/end
-                    window_start = monday
-                    window_end = sunday
-                    label_suffix = ""
-                    
-                    # Check if week falls during vacation period
-                    # If yes, don't apply public holiday extensions (vacations dominate)
-                    week_in_vacation = (
-                        self._is_in_vacation_period(monday, vacation_windows) or
-                        self._is_in_vacation_period(sunday, vacation_windows) or
-                        self._is_in_vacation_period(next_monday, vacation_windows)
-                    )
-                    
-                    # Only apply public holidays if NOT during vacation period
-                    if not week_in_vacation:
-                        # Check if Monday is a holiday (extend from previous Friday)
-                        monday_is_holiday = monday.date() in holidays
-                        # Check if Friday is a holiday (extend to next Monday)
-                        friday = pointer + timedelta(days=4)
-                        friday_is_holiday = friday.date() in holidays
-                        
-                        if monday_is_holiday:
-                            # Lundi férié: start previous Friday instead
-                            window_start = previous_friday
-                            label_suffix = " + Lundi férié"
-                        
-                        if friday_is_holiday:
-                            # Vendredi férié: extend to next Monday
-                            window_end = next_monday
-                            label_suffix = " + Vendredi férié" if not label_suffix else " + Pont"
-                    
-                    # Get label from custody type definition
-                    type_label = CUSTODY_TYPES.get(custody_type, {}).get("label", "Garde")
-                    windows.append(
-                        CustodyWindow(
-                            start=self._apply_time(window_start, self._arrival_time),
-                            end=self._apply_time(window_end, self._departure_time),
-                            label=f"Garde - {type_label}{label_suffix}",
-                            source="pattern",
-                        )
-                    )
-                pointer += timedelta(days=7)
-            return windows
 
         cycle_days = type_def["cycle_days"]
         pattern = type_def["pattern"]
@@ -772,6 +711,93 @@ class CustodyScheduleManager:
 
         return windows
 
+    def _generate_parity_windows(
+        self,
+        now: datetime,
+        horizon: datetime,
+        custody_type: str,
+        spec: PatternSpec,
+        vacation_periods: tuple[list[datetime], list[datetime]],
+    ) -> list[CustodyWindow]:
+        """Create windows for ISO week parity patterns described by a PatternSpec."""
+        windows: list[CustodyWindow] = []
+        pointer = self._reference_start(now, custody_type)
+        
+        # Get French holidays for current and next year
+        alsace_moselle = self._config.get(CONF_ALSACE_MOSELLE, False)
+        holiday_ords = _holiday_ordinals(now.year, alsace_moselle)
+        
+        # Get reference_year to determine parity (even = even weeks, odd = odd weeks)
+        reference_year = self._config.get(
+            CONF_REFERENCE_YEAR_CUSTODY, self._config.get(CONF_REFERENCE_YEAR, "even")
+        )
+        target_parity = 0 if reference_year == "even" else 1  # 0 = even, 1 = odd
+        
+        # Ajuster le pointer pour commencer avant ou à la date actuelle
+        # Si le pointer est trop loin dans le passé, avancer jusqu'à une semaine proche de maintenant
+        # On avance de 2 semaines à la fois pour respecter l'alternance
+        while pointer < now - timedelta(days=365):
+            pointer += timedelta(days=14)  # Sauter 2 semaines (alternance)
+            # Vérifier que le pointer a toujours la bonne parité
+            if _iso_week_parity(pointer) != target_parity:
+                # Si on a perdu la parité, ajuster d'une semaine
+                pointer += timedelta(days=7)
+        
+        # Sélectionner d'abord les lundis des semaines de la bonne parité,
+        # puis ne construire les fenêtres que pour ceux-ci
+        mondays: list[datetime] = []
+        one_week = timedelta(days=7)
+        while pointer < horizon:
+            if _iso_week_parity(pointer) == target_parity:  # 0 = even, 1 = odd
+                mondays.append(pointer)
+            pointer += one_week
+        if not mondays:
+            return windows
+
+        # Jours fériés indexés par (ordinal - base_ord) sur la plage couverte par les lundis
+        base_ord = mondays[0].toordinal()
+        holiday_days = bytearray(
+            mondays[-1].toordinal() - base_ord
+            + max(spec.early_holiday_offset, spec.late_holiday_offset) + 1
+        )
+        for ordinal in holiday_ords:
+            if 0 <= ordinal - base_ord < len(holiday_days):
+                holiday_days[ordinal - base_ord] = 1
+
+        type_label = CUSTODY_TYPES.get(custody_type, {}).get("label", "Garde")
+        for pointer in mondays:
+            window_start = pointer + timedelta(days=spec.start_offset)
+            window_end = pointer + timedelta(days=spec.end_offset)
+            label_suffix = ""
+            
+            # Check if the window falls during vacation period
+            # If yes, don't apply public holiday extensions (vacations dominate)
+            in_vacation = (
+                self._is_in_vacation_period(window_start, vacation_periods) or
+                self._is_in_vacation_period(window_end, vacation_periods) or
+                self._is_in_vacation_period(pointer + timedelta(days=7), vacation_periods)
+            )
+            
+            # Only apply public holidays if NOT during vacation period
+            if not in_vacation:
+                day = pointer.toordinal() - base_ord
+                if holiday_days[day + spec.early_holiday_offset]:
+                    window_start = pointer + timedelta(days=spec.early_start_offset)
+                    label_suffix = spec.early_label
+                if holiday_days[day + spec.late_holiday_offset]:
+                    window_end = pointer + timedelta(days=spec.late_end_offset)
+                    label_suffix = spec.late_label if not label_suffix else " + Pont"
+            
+            windows.append(
+                CustodyWindow(
+                    start=self._apply_time(window_start, self._arrival_time),
+                    end=self._apply_time(window_end, self._departure_time),
+                    label=f"Garde - {type_label}{label_suffix}",
+                    source="pattern",
+                )
+            )
+        return windows
+
     async def _generate_vacation_windows(self, now: datetime) -> list[CustodyWindow]:
         """Optional windows driven by vacation rules."""
         zone = self._config.get(CONF_ZONE)
@@ -1000,7 +1026,7 @@ class CustodyScheduleManager:
         candidate = datetime(year, 1, 1, tzinfo=self._tz)
         # Go to next Monday
         candidate += timedelta(days=(7 - candidate.weekday()) % 7)
-        while candidate.isocalendar().week % 2 != parity:
+        while _iso_week_parity(candidate) != parity:
             candidate += timedelta(days=7)
         return candidate
 
@@ -1016,7 +1042,7 @@ class CustodyScheduleManager:
                 continue
             week_start = cursor - timedelta(days=cursor.weekday())
             week_end = min(end, week_start + timedelta(days=7))
-            if week_start.isocalendar().week % 2 == target_parity:
+            if _iso_week_parity(week_start) == target_parity:
                 windows.append(
                     CustodyWindow(
                         start=week_start,
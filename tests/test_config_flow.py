@@ -0,0 +1,23 @@
+"""Tests for the Custody Schedule config flow helpers."""
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.custody_schedule.config_flow import _format_child_name  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Zoé", ("Zoe", "zoe")),
+        ("Jean-Pierre", ("Jean Pierre", "jean_pierre")),
+        # U+035C-U+0362 double marks transliterate to a separator
+        ("Le\u035co", ("Le O", "le_o")),
+        # U+0363-U+036F Latin letter marks transliterate to letters
+        ("Ala\u036fn", ("Alaxn", "alaxn")),
+    ],
+)
+def test_format_child_name_matches_slugify(name: str, expected: tuple[str, str]) -> None:
+    """Folded names and slugs match what slugify produces for the same input."""
+    assert _format_child_name(name) == expected